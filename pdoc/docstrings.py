@@ -14,9 +14,9 @@ accompanied by matching snapshot tests in `test/testdata/`.
 from __future__ import annotations
 
 import base64
-from functools import cache
+from collections.abc import Callable
+from functools import lru_cache
 import inspect
-import mimetypes
 import os
 from pathlib import Path
 import re
@@ -31,16 +31,44 @@ Modules may raise SystemExit on import (which we want to catch),
 but we don't want to catch a user's KeyboardInterrupt.
 """
 
+_RST_BASED_FORMATS = ("google", "numpy", "restructuredtext")
 
-@cache
+_DEFAULT_DOCSTRING_CACHE_SIZE = 65536
+
+
+def _docstring_cache_size() -> int:
+    """Read the size of `convert`'s cache from `PDOC_DOCSTRING_CACHE_SIZE`."""
+    value = os.environ.get("PDOC_DOCSTRING_CACHE_SIZE", "")
+    if not value:
+        return _DEFAULT_DOCSTRING_CACHE_SIZE
+    try:
+        return int(value)
+    except ValueError:
+        warnings.warn(
+            f"Invalid value for PDOC_DOCSTRING_CACHE_SIZE: {value!r} is not an integer. "
+            f"Using the default of {_DEFAULT_DOCSTRING_CACHE_SIZE} instead."
+        )
+        return _DEFAULT_DOCSTRING_CACHE_SIZE
+
+
+@lru_cache(maxsize=_docstring_cache_size())
 def convert(docstring: str, docformat: str, source_file: Path | None) -> str:
     """
     Convert `docstring` from `docformat` to Markdown.
+
+    Results are cached as every docstring is converted twice, once for the HTML pages
+    and once for the search index. The cache holds up to 65536 docstrings by default,
+    which can be changed with the `PDOC_DOCSTRING_CACHE_SIZE` environment variable.
+    Projects with more docstrings than that should raise the limit to avoid converting
+    everything twice, memory-constrained environments may want to lower it.
     """
+    if not docstring or docstring.isspace():
+        return docstring
+
     docformat = docformat.lower()
 
     try:
-        if any(x in docformat for x in ["google", "numpy", "restructuredtext"]):
+        if any(x in docformat for x in _RST_BASED_FORMATS):
             docstring = rst(docstring, source_file)
 
         if "google" in docformat:
@@ -62,46 +90,83 @@ def convert(docstring: str, docformat: str, source_file: Path | None) -> str:
     return docstring
 
 
-def embed_images(docstring: str, source_file: Path) -> str:
-    def local_image_to_data_uri(href: str) -> str:
-        image_path = source_file.parent / href
+_EMBED_MD_IMG_RE = re.compile(
+    r"(?P<before>!\[\s*.*?\s*]\(\s*)(?P<href>.+?)(?P<after>\s*\))"
+)
+_EMBED_HTML_SRC_RE = re.compile(r"""(?P<before>src=['"])(?P<href>.+?)(?P<after>['"])""")
+
+
+@lru_cache(maxsize=64)
+def _guess_mime_type(suffixes: str) -> str | None:
+    """Guess the MIME type for a file extension such as `.png` or `.svg.gz`."""
+    # imported lazily so that library users who only `import pdoc` don't load it.
+    import mimetypes
+
+    return mimetypes.guess_type(f"x{suffixes}")[0]
+
+
+_MAX_EMBEDDED_IMAGE_SIZE = 10_000_000
+
+
+@lru_cache(maxsize=256)
+def _image_to_data_uri(image_path: Path) -> str | None:
+    """
+    Read a local image and return it as a `data:` URI, or `None` if it cannot be read.
+
+    Images such as project logos are often referenced from many docstrings,
+    so we cache both the encoded result and failed lookups.
+    Images larger than 10 MB are not embedded, they should be linked instead.
+    """
+    try:
+        if image_path.stat().st_size > _MAX_EMBEDDED_IMAGE_SIZE:
+            warnings.warn(
+                f"Not embedding {image_path} as it is larger than {_MAX_EMBEDDED_IMAGE_SIZE:,} bytes, consider linking to it instead."
+            )
+            return None
         image_data = image_path.read_bytes()
-        image_mime = mimetypes.guess_type(image_path)[0]
-        image_data_b64 = base64.b64encode(image_data).decode()
-        return f"data:{image_mime};base64,{image_data_b64}"
+        image_mime = _guess_mime_type("".join(image_path.suffixes))
+        image_data_b64 = base64.b64encode(image_data).decode("ascii")
+    except Exception:
+        return None
+    return f"data:{image_mime};base64,{image_data_b64}"
+
 
+def embed_images(docstring: str, source_file: Path) -> str:
     def embed_local_image(m: re.Match) -> str:
-        try:
-            href = local_image_to_data_uri(m["href"])
-        except Exception:
+        href = _image_to_data_uri(source_file.parent / m["href"])
+        if href is None:
             return m[0]
         else:
             return m["before"] + href + m["after"]
 
     # TODO: Could probably do more here, e.g. support rST replacements.
-    for regex in [
-        r"(?P<before>!\[\s*.*?\s*]\(\s*)(?P<href>.+?)(?P<after>\s*\))",
-        r"""(?P<before>src=['"])(?P<href>.+?)(?P<after>['"])""",
-    ]:
-        docstring = re.sub(regex, embed_local_image, docstring)
+    # The two patterns are applied one after another (and not as a single alternation),
+    # as an unclosed Markdown image would otherwise swallow a subsequent <img> tag.
+    if "![" in docstring:
+        docstring = _EMBED_MD_IMG_RE.sub(embed_local_image, docstring)
+    if "src=" in docstring:
+        docstring = _EMBED_HTML_SRC_RE.sub(embed_local_image, docstring)
     return docstring
 
 
+_GOOGLE_SECTION_RE = re.compile(
+    r"""
+    ^(?P<name>[A-Z][A-Z a-z]+):\n
+    (?P<contents>(
+        \n        # empty lines
+        |         # or
+        [ \t].+$  # lines with indentation
+    )+)$
+    """,
+    flags=re.VERBOSE | re.MULTILINE,
+)
+
+
 def google(docstring: str) -> str:
     """Convert Google-style docstring sections into Markdown."""
-    return re.sub(
-        r"""
-        ^(?P<name>[A-Z][A-Z a-z]+):\n
-        (?P<contents>(
-            \n        # empty lines
-            |         # or
-            [ \t]+.+  # lines with indentation
-        )+)$
-        """,
-        _google_section,
-        docstring,
-        flags=re.VERBOSE | re.MULTILINE,
-    )
+    if ":\n" not in docstring:
+        return docstring
+    return _GOOGLE_SECTION_RE.sub(_google_section, docstring)
 
 
 GOOGLE_LIST_SECTIONS = ["Args", "Raises", "Attributes"]
@@ -119,6 +184,11 @@ nevertheless.
 """
 
 
+def _indent_all(text: str, prefix: str) -> str:
+    """Like `textwrap.indent`, but also prefixes lines that consist solely of whitespace."""
+    return "".join(prefix + line for line in text.splitlines(keepends=True))
+
+
 def _google_section(m: re.Match[str]) -> str:
     name = m.group("name")
     contents = dedent(m.group("contents")).lstrip()
@@ -127,19 +197,20 @@ def _google_section(m: re.Match[str]) -> str:
         name = GOOGLE_LIST_SECTION_ALIASES[name]
 
     if name in GOOGLE_LIST_SECTIONS:
-        items = _indented_list(contents)
-        contents = ""
-        for item in items:
-            try:
-                # first ":" on the first line
-                _, attr, desc = re.split(r"^(.+?:)", item, maxsplit=1)
-            except ValueError:
-                contents += " - " + indent(item, "   ")[3:]
+        parts: list[str] = []
+        for item in _indented_list(contents):
+            # first ":" on the first line
+            first_line_end = item.find("\n")
+            colon = item.find(":", 1, first_line_end if first_line_end != -1 else None)
+            if colon == -1:
+                parts.append(" - " + indent(item, "   ")[3:])
             else:
-                contents += f" - **{attr}** " + indent(desc, "   ")[3:]
-            contents += "\n"
+                attr, desc = item[: colon + 1], item[colon + 1 :]
+                parts.append(f" - **{attr}** " + indent(desc, "   ")[3:])
+            parts.append("\n")
+        contents = "".join(parts)
     else:
-        contents = indent(contents, "> ", lambda line: True)
+        contents = _indent_all(contents, "> ")
 
     if name == "Args":
         name = "Arguments"
@@ -169,18 +240,29 @@ def _indented_list(contents: str) -> list[str]:
     assert not contents.startswith(" "), contents
     assert not contents.startswith("\n"), contents
 
-    ret: list[str] = []
+    # collect lines per item and join them once, repeated str concatenation is quadratic.
+    ret: list[list[str]] = []
     for line in contents.splitlines(keepends=True):
         empty = not line.strip()
         indented = line.startswith(" ")
         if not (empty or indented):
             # new section
-            ret.append(line)
+            ret.append([line])
         else:
             # append to current section
-            ret[-1] += line
+            ret[-1].append(line)
+
+    return [inspect.cleandoc("".join(x)) for x in ret]
 
-    return [inspect.cleandoc(x) for x in ret]
+
+_NUMPY_HEADING_RE = re.compile(
+    r"""
+    ^([A-Z][A-Za-z ]+)\n  # a heading
+    ---+\n+              # followed by a dashed line
+    """,
+    flags=re.VERBOSE | re.MULTILINE,
+)
+_NUMPY_SECTION_END_RE = re.compile(r"\n(?![ \n])")
 
 
 def numpy(docstring: str) -> str:
@@ -188,47 +270,52 @@ def numpy(docstring: str) -> str:
 
     See <https://numpydoc.readthedocs.io/en/latest/format.html> for details.
     """
-    sections = re.split(
-        r"""
-        ^([A-Z][A-Za-z ]+)\n  # a heading
-        ---+\n+              # followed by a dashed line
-        """,
-        docstring,
-        flags=re.VERBOSE | re.MULTILINE,
-    )
-    contents = sections[0]
-    for heading, content in zip(sections[1::2], sections[2::2]):
-        if content.startswith(" ") and re.search(r"\n(?![ \n])", content):
-            # If the first line of section content is indented, we consider the section to be finished
-            # on the first non-indented line. We take out the rest - the tail - here.
-            content, tail = re.split(r"\n(?![ \n])", content, maxsplit=1)
-        else:
-            tail = ""
-
-        content = dedent(content)
-
-        if heading in (
-            "Parameters",
-            "Returns",
-            "Yields",
-            "Receives",
-            "Other Parameters",
-            "Raises",
-            "Warns",
-            "Attributes",
-        ):
-            contents += f"###### {heading}\n{_numpy_parameters(content)}"
-        elif heading == "See Also":
-            contents += f"###### {heading}\n{_numpy_seealso(content)}"
-        else:
-            contents += f"###### {heading}\n{content}"
-        contents += tail
-    return contents
+    if "---" not in docstring:
+        return docstring
+    headings = _NUMPY_HEADING_RE.finditer(docstring)
+    m = next(headings, None)
+    if m is None:
+        return docstring
+    parts = [docstring[: m.start()]]
+    while m is not None:
+        heading, start = m.group(1), m.end()
+        m = next(headings, None)
+        end = m.start() if m is not None else len(docstring)
+        parts.append(_numpy_section(heading, docstring[start:end]))
+    return "".join(parts)
+
+
+def _numpy_section(heading: str, content: str) -> str:
+    """Convert a single NumPy-style section into Markdown"""
+    tail = ""
+    if content.startswith(" "):
+        # If the first line of section content is indented, we consider the section to be finished
+        # on the first non-indented line. We take out the rest - the tail - here.
+        if end := _NUMPY_SECTION_END_RE.search(content):
+            content, tail = content[: end.start()], content[end.end() :]
+
+    content = dedent(content)
+
+    if heading in (
+        "Parameters",
+        "Returns",
+        "Yields",
+        "Receives",
+        "Other Parameters",
+        "Raises",
+        "Warns",
+        "Attributes",
+    ):
+        return f"###### {heading}\n{_numpy_parameters(content)}{tail}"
+    elif heading == "See Also":
+        return f"###### {heading}\n{_numpy_seealso(content)}{tail}"
+    else:
+        return f"###### {heading}\n{content}{tail}"
 
 
 def _numpy_seealso(content: str) -> str:
     """Convert a NumPy-style "See Also" section into Markdown"""
-    contents = ""
+    parts: list[str] = []
     for item in _indented_list(content):
         if ":" in item:
             funcstr, desc = item.split(":", maxsplit=1)
@@ -238,17 +325,20 @@ def _numpy_seealso(content: str) -> str:
 
         funclist = [f.strip() for f in funcstr.split(" ")]
         funcs = ", ".join(f"`{f}`" for f in funclist if f)
-        contents += f"{funcs}{desc}  \n"
-    return contents
+        parts.append(f"{funcs}{desc}  \n")
+    return "".join(parts)
+
+
+_NUMPY_PARAMETER_RE = re.compile(r"^(.+):(.+)([\s\S]*)")
 
 
 def _numpy_parameters(content: str) -> str:
     """Convert a NumPy-style parameter section into Markdown"""
-    contents = ""
+    parts: list[str] = []
     for item in _indented_list(content):
-        m = re.match(r"^(.+):(.+)([\s\S]*)", item)
+        m = _NUMPY_PARAMETER_RE.match(item)
         if m:
-            contents += (
+            parts.append(
                 f" - **{m.group(1).strip()}** ({m.group(2).strip()}):\n"
                 f"{indent(m.group(3).strip(), '   ')}\n"
             )
@@ -261,10 +351,22 @@ def _numpy_parameters(content: str) -> str:
                 name, desc = item.strip(), ""
 
             if desc:
-                contents += f" - **{name}**: {desc}\n"
+                parts.append(f" - **{name}**: {desc}\n")
             else:
-                contents += f" - **{name}**\n"
-    return f"{contents}\n"
+                parts.append(f" - **{name}**\n")
+    return "".join(parts) + "\n"
+
+
+_RST_INLINE_RE = re.compile(
+    r"""
+    (?::py)?:(?:meth|func):`(?P<call>[^`]+)`
+    |
+    (?::py)?:(?:mod|data|const|class|attr|exc|obj):`(?P<ref>[^`]+)`
+    |
+    :math:`(?P<math>.+?)`
+    """,
+    flags=re.VERBOSE,
+)
 
 
 def rst(contents: str, source_file: Path | None) -> str:
@@ -275,23 +377,19 @@ def rst(contents: str, source_file: Path | None) -> str:
     contents = _rst_admonitions(contents, source_file)
     contents = _rst_links(contents)
 
-    def replace_reference(m):
-        _, kind, name = m.groups()
-        if kind in ("meth", "func"):
-            return f"`{name}()`"
+    def replace_inline(m: re.Match[str]) -> str:
+        if m.lastgroup == "call":
+            return f"`{m['call']}()`"
+        elif m.lastgroup == "ref":
+            return f"`{m['ref']}`"
         else:
-            return f"`{name}`"
-
-    # Code References: :obj:`foo` -> `foo`
-    contents = re.sub(
-        r"(:py)?:(mod|func|data|const|class|meth|attr|exc|obj):`([^`]+)`",
-        replace_reference,
-        contents,
-    )
+            # We don't use $ as that's not enabled by MathJax by default.
+            return f"\\\\( {m['math']} \\\\)"
 
+    # Code References: :obj:`foo` -> `foo`, :func:`foo` -> `foo()`
     # Math: :math:`foo` -> \\( foo \\)
-    # We don't use $ as that's not enabled by MathJax by default.
-    contents = re.sub(r":math:`(.+?)`", r"\\\\( \1 \\\\)", contents)
+    if ":`" in contents:
+        contents = _RST_INLINE_RE.sub(replace_inline, contents)
 
     contents = _rst_footnotes(contents)
 
@@ -300,8 +398,25 @@ def rst(contents: str, source_file: Path | None) -> str:
     return contents
 
 
+_RST_FOOTNOTE_REGISTER_RE = re.compile(
+    r"""
+    ^(?P<indent>[ ]*)\.\.[ ]+\[(?P<id>\d+|[#*]\w*)](?P<content>.*
+    (
+        \n                 # empty lines
+        |                  # or
+        (?P=indent)[ ].+$  # lines with indentation
+    )*)$
+    """,
+    flags=re.MULTILINE | re.VERBOSE,
+)
+_RST_FOOTNOTE_REF_RE = re.compile(r"\[(?P<id>\d+|[#*]\w*)]_")
+
+
 def _rst_footnotes(contents: str) -> str:
     """Convert reStructuredText footnotes"""
+    # footnote references are only replaced if there is a matching footnote definition.
+    if ".." not in contents or "[" not in contents:
+        return contents
     footnotes: set[str] = set()
     autonum: int
 
@@ -318,19 +433,9 @@ def _rst_footnotes(contents: str) -> str:
 
     # Register footnotes
     autonum = 1
-    contents = re.sub(
-        r"""
-            ^(?P<indent>[ ]*)\.\.[ ]+\[(?P<id>\d+|[#*]\w*)](?P<content>.*
-            (
-                \n                 # empty lines
-                |                  # or
-                (?P=indent)[ ]+.+  # lines with indentation
-            )*)$
-            """,
-        register_footnote,
-        contents,
-        flags=re.MULTILINE | re.VERBOSE,
-    )
+    contents = _RST_FOOTNOTE_REGISTER_RE.sub(register_footnote, contents)
+    if not footnotes or "]_" not in contents:
+        return contents
 
     def replace_references(m: re.Match[str]) -> str:
         nonlocal autonum
@@ -345,42 +450,47 @@ def _rst_footnotes(contents: str) -> str:
             return m.group(0)
 
     autonum = 1
-    contents = re.sub(r"\[(?P<id>\d+|[#*]\w*)]_", replace_references, contents)
+    contents = _RST_FOOTNOTE_REF_RE.sub(replace_references, contents)
     return contents
 
 
+_RST_EMBEDDED_URI_RE = re.compile(r"`(?P<text>[^`]+)<(?P<url>.+?)>`_")
+_RST_LINK_TARGET_RE = re.compile(
+    r"^[ \t]*..\s+_(?P<id>[^\n:]+):\s*(?P<url>http\S+)", flags=re.MULTILINE
+)
+_RST_LINK_REF_RE = re.compile(r"(?P<id>[A-Za-z0-9_\-.:+]|`[^`]+`)_")
+
+
 def _rst_links(contents: str) -> str:
     """Convert reStructuredText hyperlinks"""
+    if "_" not in contents:
+        return contents
     links = {}
 
     def register_link(m: re.Match[str]) -> str:
-        refid = re.sub(r"\s", "", m.group("id").lower())
+        refid = "".join(m.group("id").lower().split())
         links[refid] = m.group("url")
         return ""
 
     def replace_link(m: re.Match[str]) -> str:
         text = m.group("id")
-        refid = re.sub(r"[\s`]", "", text.lower())
+        refid = "".join(text.lower().split()).replace("`", "")
         try:
             return f"[{text.strip('`')}]({links[refid]})"
         except KeyError:
             return m.group(0)
 
     # Embedded URIs
-    contents = re.sub(
-        r"`(?P<text>[^`]+)<(?P<url>.+?)>`_", r"[\g<text>](\g<url>)", contents
-    )
+    contents = _RST_EMBEDDED_URI_RE.sub(r"[\g<text>](\g<url>)", contents)
     # External Hyperlink Targets
-    contents = re.sub(
-        r"^\s*..\s+_(?P<id>[^\n:]+):\s*(?P<url>http\S+)",
-        register_link,
-        contents,
-        flags=re.MULTILINE,
-    )
-    contents = re.sub(r"(?P<id>[A-Za-z0-9_\-.:+]|`[^`]+`)_", replace_link, contents)
+    contents = _RST_LINK_TARGET_RE.sub(register_link, contents)
+    contents = _RST_LINK_REF_RE.sub(replace_link, contents)
     return contents
 
 
+_RST_OPTION_RE = re.compile(r"\s*:(.+?):(.*)")
+
+
 def _rst_extract_options(contents: str) -> tuple[str, dict[str, str]]:
     """
     Extract options from the beginning of reStructuredText directives.
@@ -388,11 +498,13 @@ def _rst_extract_options(contents: str) -> tuple[str, dict[str, str]]:
     Return the trimmed content and a dict of options.
     """
     options = {}
-    while match := re.match(r"^\s*:(.+?):(.*)([\s\S]*)", contents):
-        key, value, contents = match.groups()
+    pos = 0
+    while match := _RST_OPTION_RE.match(contents, pos):
+        key, value = match.groups()
         options[key] = value.strip()
+        pos = match.end()
 
-    return contents, options
+    return contents[pos:], options
 
 
 def _rst_include_trim(contents: str, options: dict[str, str]) -> str:
@@ -407,17 +519,140 @@ def _rst_include_trim(contents: str, options: dict[str, str]) -> str:
             lines = lines[int(i) :]
         contents = "\n".join(lines)
     if x := options.get("end-before"):
-        contents = contents[: contents.index(x)]
+        contents, found, _ = contents.partition(x)
+        if not found:
+            raise ValueError(f"end-before marker {x!r} not found")
     if x := options.get("start-after"):
-        contents = contents[contents.index(x) + len(x) :]
+        _, found, contents = contents.partition(x)
+        if not found:
+            raise ValueError(f"start-after marker {x!r} not found")
     return contents
 
 
+_RST_ADMONITION_TYPES = "note|warning|danger|versionadded|versionchanged|deprecated|seealso|math|include|code-block"
+_RST_ADMONITION_RE = re.compile(
+    rf"""
+    ^(?P<indent>[ ]*)\.\.[ ]+(?P<type>{_RST_ADMONITION_TYPES})::(?P<val>.*)
+    (?P<contents>(
+        \n                 # empty lines
+        |                  # or
+        (?P=indent)[ ].+$  # lines with indentation
+    )*)$
+    """,
+    flags=re.MULTILINE | re.VERBOSE,
+)
+
+
+def _rst_include(
+    type: str,
+    ind: str,
+    val: str,
+    contents: str,
+    options: dict[str, str],
+    source_file: Path | None,
+) -> str:
+    loc = source_file or Path(".")
+    try:
+        included = (loc.parent / val).read_text("utf8", "replace")
+    except OSError as e:
+        warnings.warn(f"Cannot include {val!r}: {e}")
+        included = "\n"
+    try:
+        included = _rst_include_trim(included, options) + "\n"
+    except ValueError as e:
+        warnings.warn(f"Failed to process include options for {val!r}: {e}")
+    included = _rst_admonitions(included, loc.parent / val)
+    included = embed_images(included, loc.parent / val)
+    return indent(included, ind)
+
+
+def _rst_math(
+    type: str,
+    ind: str,
+    val: str,
+    contents: str,
+    options: dict[str, str],
+    source_file: Path | None,
+) -> str:
+    return f"{ind}$${val}{contents}$$\n"
+
+
+def _rst_alert(
+    type: str,
+    ind: str,
+    val: str,
+    contents: str,
+    options: dict[str, str],
+    source_file: Path | None,
+) -> str:
+    if val:
+        heading = f"{ind}###### {val}\n"
+    else:
+        heading = ""
+    return (
+        f'{ind}<div class="alert {type}" markdown="1">\n'
+        f"{heading}"
+        f"{indent(contents, ind)}\n"
+        f"{ind}</div>\n"
+    )
+
+
+def _rst_code_block(
+    type: str,
+    ind: str,
+    val: str,
+    contents: str,
+    options: dict[str, str],
+    source_file: Path | None,
+) -> str:
+    return f"{ind}```{val}\n{contents}\n```\n"
+
+
+_RST_VERSION_TITLES = {
+    "versionadded": "New in version",
+    "versionchanged": "Changed in version",
+    "deprecated": "Deprecated since version",
+}
+
+
+def _rst_generic_admonition(
+    type: str,
+    ind: str,
+    val: str,
+    contents: str,
+    options: dict[str, str],
+    source_file: Path | None,
+) -> str:
+    if type in _RST_VERSION_TITLES:
+        text = f"{_RST_VERSION_TITLES[type]} {val}"
+    else:
+        text = f"{type} {val}".strip()
+
+    if contents:
+        return f"{ind}*{text}:*\n{indent(contents, ind)}\n\n"
+    else:
+        return f"{ind}*{text}.*\n"
+
+
+_RST_ADMONITION_FORMATTERS: dict[
+    str, Callable[[str, str, str, str, dict[str, str], Path | None], str]
+] = {
+    "include": _rst_include,
+    "math": _rst_math,
+    "note": _rst_alert,
+    "warning": _rst_alert,
+    "danger": _rst_alert,
+    "code-block": _rst_code_block,
+}
+
+
 def _rst_admonitions(contents: str, source_file: Path | None) -> str:
     """
     Convert reStructuredText admonitions - a bit tricky because they may already be indented themselves.
     <https://www.sphinx-doc.org/en/master/usage/restructuredtext/directives.html>
     """
+    if ".." not in contents:
+        return contents
 
     def _rst_admonition(m: re.Match[str]) -> str:
         ind = m.group("indent")
@@ -426,65 +661,24 @@ def _rst_admonitions(contents: str, source_file: Path | None) -> str:
         contents = dedent(m.group("contents")).strip()
         contents, options = _rst_extract_options(contents)
 
-        if type == "include":
-            loc = source_file or Path(".")
-            try:
-                included = (loc.parent / val).read_text("utf8", "replace")
-            except OSError as e:
-                warnings.warn(f"Cannot include {val!r}: {e}")
-                included = "\n"
-            try:
-                included = _rst_include_trim(included, options) + "\n"
-            except ValueError as e:
-                warnings.warn(f"Failed to process include options for {val!r}: {e}")
-            included = _rst_admonitions(included, loc.parent / val)
-            included = embed_images(included, loc.parent / val)
-            return indent(included, ind)
-        if type == "math":
-            return f"{ind}$${val}{contents}$$\n"
-        if type in ("note", "warning", "danger"):
-            if val:
-                heading = f"{ind}###### {val}\n"
-            else:
-                heading = ""
-            return (
-                f'{ind}<div class="alert {type}" markdown="1">\n'
-                f"{heading}"
-                f"{indent(contents, ind)}\n"
-                f"{ind}</div>\n"
-            )
-        if type == "code-block":
-            return f"{ind}```{val}\n{contents}\n```\n"
-        if type == "versionadded":
-            text = f"New in version {val}"
-        elif type == "versionchanged":
-            text = f"Changed in version {val}"
-        elif type == "deprecated":
-            text = f"Deprecated since version {val}"
-        else:
-            text = f"{type} {val}".strip()
+        formatter = _RST_ADMONITION_FORMATTERS.get(type, _rst_generic_admonition)
+        return formatter(type, ind, val, contents, options, source_file)
+
+    return _RST_ADMONITION_RE.sub(_rst_admonition, contents)
 
-        if contents:
-            text = f"{ind}*{text}:*\n{indent(contents, ind)}\n\n"
-        else:
-            text = f"{ind}*{text}.*\n"
-
-        return text
-
-    admonition = "note|warning|danger|versionadded|versionchanged|deprecated|seealso|math|include|code-block"
-    return re.sub(
-        rf"""
-            ^(?P<indent>[ ]*)\.\.[ ]+(?P<type>{admonition})::(?P<val>.*)
-            (?P<contents>(
-                \n                 # empty lines
-                |                  # or
-                (?P=indent)[ ]+.+  # lines with indentation
-            )*)$
-        """,
-        _rst_admonition,
-        contents,
-        flags=re.MULTILINE | re.VERBOSE,
-    )
+
+_RST_FIELD_TYPES = "param|type|return|rtype|raises"
+_RST_FIELD_RE = re.compile(
+    rf"""
+    ^:(?P<type>{_RST_FIELD_TYPES})(?:[ ]+(?P<name>.+))?:
+    (?P<body>.*(
+        (?:\n[ ]*)*  # maybe some empty lines followed by
+        [ ]+.+       # lines with indentation
+    )*(?:\n|$))
+    """,
+    flags=re.MULTILINE | re.VERBOSE,
+)
+_RST_FIELD_MARKERS = tuple(f":{field}" for field in _RST_FIELD_TYPES.split("|"))
 
 
 def _rst_fields(contents: str) -> str:
@@ -492,6 +686,8 @@ def _rst_fields(contents: str) -> str:
     Convert reStructuredText fields to Markdown.
     <https://www.sphinx-doc.org/en/master/usage/restructuredtext/basics.html#rst-field-lists>
     """
+    if not any(marker in contents for marker in _RST_FIELD_MARKERS):
+        return contents
 
     _has_parameter_section = False
     _has_raises_section = False
@@ -515,7 +711,7 @@ def _rst_fields(contents: str) -> str:
         elif type == "type":
             return ""  # we expect users to use modern type annotations.
         elif type == "return":
-            body = indent(body, "> ", lambda line: True)
+            body = _indent_all(body, "> ")
             return f"\n###### Returns\n{body}"
         elif type == "rtype":
             return ""  # we expect users to use modern type annotations.
@@ -529,16 +725,4 @@ def _rst_fields(contents: str) -> str:
         else:  # pragma: no cover
             raise AssertionError("unreachable")
 
-    field = "param|type|return|rtype|raises"
-    return re.sub(
-        rf"""
-            ^:(?P<type>{field})(?:[ ]+(?P<name>.+))?:
-            (?P<body>.*(
-                (?:\n[ ]*)*  # maybe some empty lines followed by
-                [ ]+.+       # lines with indentation
-            )*(?:\n|$))
-        """,
-        _rst_field,
-        contents,
-        flags=re.MULTILINE | re.VERBOSE,
-    )
+    return _RST_FIELD_RE.sub(_rst_field, contents)
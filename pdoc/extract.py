@@ -343,6 +343,7 @@ def invalidate_caches(module_name: str) -> None:
     pdoc.doc.Module.from_name.cache_clear()
     pdoc.doc_ast._get_source.cache_clear()
     pdoc.docstrings.convert.cache_clear()
+    pdoc.docstrings._image_to_data_uri.cache_clear()
 
     prefix = f"{module_name}."
     mods = sorted(
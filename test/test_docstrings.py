@@ -25,6 +25,10 @@ def test_numpy(s):
     assert not s or ret
 
 
+def test_numpy_dashes_without_heading():
+    assert docstrings.numpy("foo\n---bar") == "foo\n---bar"
+
+
 @given(text())
 def test_rst(s):
     ret = docstrings.rst(s, None)
@@ -37,6 +41,58 @@ def test_rst_extract_options_fuzz(s):
     assert not s or content or options
 
 
+N = 100_000
+
+
+@pytest.mark.timeout(5)
+@pytest.mark.parametrize(
+    "regex,s,group,expected",
+    [
+        (
+            docstrings._GOOGLE_SECTION_RE,
+            "Args:\n" + "\n" * N + "    x_: y\n",
+            "contents",
+            "\n" * N + "    x_: y\n",
+        ),
+        (
+            docstrings._GOOGLE_SECTION_RE,
+            "Args:\n" + "    x_" * N + "\n" + " \n" * N,
+            "contents",
+            "    x_" * N,
+        ),
+        (
+            docstrings._RST_ADMONITION_RE,
+            ".. note::\n" + "   x_" * N + "\n" + " \n" * N,
+            "contents",
+            "\n" + "   x_" * N,
+        ),
+        (
+            docstrings._RST_FOOTNOTE_REGISTER_RE,
+            ".. [1] foo_\n" + "   x" * N + "\n" + " \n" * N,
+            "content",
+            " foo_\n" + "   x" * N,
+        ),
+    ],
+    ids=["google-empty-lines", "google-indented", "rst-admonition", "rst-footnote"],
+)
+def test_no_catastrophic_backtracking(regex, s, group, expected):
+    assert regex.search(s)[group] == expected
+    # all inputs contain "_" so that the rST hyperlink regexes run as well.
+    docstrings.convert(s, "google", None)
+
+
+def test_convert_cache_size(monkeypatch):
+    assert docstrings.convert.cache_info().maxsize == docstrings._docstring_cache_size()
+
+    monkeypatch.delenv("PDOC_DOCSTRING_CACHE_SIZE", raising=False)
+    assert docstrings._docstring_cache_size() == 65536
+    monkeypatch.setenv("PDOC_DOCSTRING_CACHE_SIZE", "42")
+    assert docstrings._docstring_cache_size() == 42
+    monkeypatch.setenv("PDOC_DOCSTRING_CACHE_SIZE", "abc")
+    with pytest.warns(UserWarning, match="Invalid value for PDOC_DOCSTRING_CACHE_SIZE"):
+        assert docstrings._docstring_cache_size() == 65536
+
+
 def test_convert_exception(monkeypatch):
     def raise_(*_):
         raise Exception
@@ -100,3 +156,59 @@ def test_rst_include_invalid_options():
             ".. include:: ../README.md\n   :start-line: invalid",
             here / "test_docstrings.py",
         )
+
+
+def test_embed_images(tmp_path):
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG")
+    source_file = tmp_path / "mod.py"
+    docstring = "![logo](logo.png) ![missing](missing.png) <img src='logo.png'>"
+    embedded = docstring.replace("logo.png", "data:image/png;base64,iVBORw==")
+
+    docstrings._image_to_data_uri.cache_clear()
+    assert docstrings.embed_images(docstring, source_file) == embedded
+    assert docstrings._image_to_data_uri.cache_info().hits == 1
+
+    # missing files are cached as well.
+    (tmp_path / "missing.png").write_bytes(b"")
+    assert docstrings.embed_images(docstring, source_file) == embedded
+
+
+def test_embed_images_unclosed_markdown(tmp_path):
+    (tmp_path / "a.png").write_bytes(b"\x89PNG")
+    (tmp_path / "b.svg").write_bytes(b"<svg/>")
+    docstring = "![a <img src='b.svg'> ![a](a.png)"
+
+    docstrings._image_to_data_uri.cache_clear()
+    assert docstrings.embed_images(docstring, tmp_path / "mod.py") == (
+        "![a <img src='data:image/svg+xml;base64,PHN2Zy8+'> "
+        "![a](data:image/png;base64,iVBORw==)"
+    )
+
+
+def test_embed_images_too_large(tmp_path, monkeypatch):
+    monkeypatch.setattr(docstrings, "_MAX_EMBEDDED_IMAGE_SIZE", 3)
+    (tmp_path / "large.png").write_bytes(b"\x89PNG")
+    docstring = "![large](large.png)"
+
+    docstrings._image_to_data_uri.cache_clear()
+    with pytest.warns(UserWarning, match="Not embedding .+ larger than 3 bytes"):
+        assert docstrings.embed_images(docstring, tmp_path / "mod.py") == docstring
+
+
+def test_rst_footnotes_undefined_reference():
+    assert docstrings._rst_footnotes(".. [1] a\n\n[2]_ [1]_") == "[^1]: a\n\n[2]_ [^1]"
+
+
+@pytest.mark.parametrize("option", ["start-after", "end-before"])
+def test_rst_include_trim_pattern_not_found(option):
+    with pytest.raises(ValueError, match=f"{option} marker 'foxtrot' not found"):
+        docstrings._rst_include_trim("alpha\nbeta", {option: "foxtrot"})
+
+
+def test_indented_list():
+    assert docstrings._indented_list("foo:\n    desc\nbar: int\n\n    more\n") == [
+        "foo:\ndesc",
+        "bar: int\n\nmore",
+    ]
+    # like str.splitlines(), we also start a new item after line boundaries other than \n.
+    assert docstrings._indented_list("a: x\rb: y\n") == ["a: x\r", "b: y"]